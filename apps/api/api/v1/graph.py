@@ -1,13 +1,12 @@
 import logging
 from typing import Annotated
 
-import voyageai
+import numpy as np
 from fastapi import APIRouter, Depends, HTTPException
-from langchain_cerebras import ChatCerebras
-from qdrant_client import AsyncQdrantClient
 
-from core.clients import get_cerebras_llm, get_qdrant_client, get_voyage_client
+from core.clients import get_embedding_service, get_inference_service, get_vector_store_service
 from core.exceptions import EmbeddingServiceError, InferenceError, VectorStoreError
+from core.text import to_kebab_case
 from models.schemas import (
     ExpandRequest,
     ExpandResponse,
@@ -17,7 +16,7 @@ from models.schemas import (
     SimilarityRequest,
     SimilarityResponse,
 )
-from services.embedding import EmbeddingService
+from services.embedding import EmbeddingService, l2_normalize
 from services.inference import InferenceService
 from services.vector_store import VectorStoreService
 
@@ -26,26 +25,18 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/graph", tags=["graph"])
 
 
-def to_kebab_case(text: str) -> str:
-    return text.lower().replace(" ", "-").replace("_", "-")
-
-
 @router.post("/expand", response_model=ExpandResponse)
 async def expand_topic(
     request: ExpandRequest,
-    voyage_client: Annotated[voyageai.Client, Depends(get_voyage_client)],
-    qdrant_client: Annotated[AsyncQdrantClient, Depends(get_qdrant_client)],
-    cerebras_llm: Annotated[ChatCerebras, Depends(get_cerebras_llm)],
+    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+    vector_store: Annotated[VectorStoreService, Depends(get_vector_store_service)],
+    inference_service: Annotated[InferenceService, Depends(get_inference_service)],
 ) -> ExpandResponse:
     logger.info(f"Expanding topic: {request.topic}")
 
-    embedding_service = EmbeddingService(voyage_client)
-    vector_store = VectorStoreService(qdrant_client)
-    inference_service = InferenceService(cerebras_llm)
-
     try:
         query_embedding = await embedding_service.embed_query(request.topic)
-        similar_concepts = await vector_store.search_similar(query_embedding, limit=10)
+        similar_concepts = await vector_store.search_similar_labels(query_embedding, limit=10)
 
         result = await inference_service.expand_topic(
             topic=request.topic,
@@ -55,13 +46,22 @@ async def expand_topic(
             source_node_id=request.source_node_id,
         )
 
+        # Skip labels repeated within this expansion or already returned by the vector search
+        known_labels = {to_kebab_case(label) for label in similar_concepts}
+        new_nodes = []
         for node in result.nodes:
-            node_embedding = await embedding_service.embed_query(node.label)
-            await vector_store.store_concept(
-                label=node.label,
-                embedding=node_embedding,
-                metadata={"reason": node.reason, "type": node.type},
-            )
+            label_key = to_kebab_case(node.label)
+            if label_key not in known_labels:
+                known_labels.add(label_key)
+                new_nodes.append(node)
+
+        node_embeddings = await embedding_service.embed([node.label for node in new_nodes])
+        await vector_store.store_concepts(
+            [
+                (node.label, node_embedding, {"reason": node.reason, "type": node.type})
+                for node, node_embedding in zip(new_nodes, node_embeddings)
+            ]
+        )
 
         logger.info(f"Successfully expanded topic '{request.topic}' with {len(result.nodes)} nodes")
         return ExpandResponse(
@@ -83,14 +83,11 @@ async def expand_topic(
 @router.post("/seed", response_model=SeedResponse)
 async def seed_topic(
     request: SeedRequest,
-    voyage_client: Annotated[voyageai.Client, Depends(get_voyage_client)],
-    qdrant_client: Annotated[AsyncQdrantClient, Depends(get_qdrant_client)],
+    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
+    vector_store: Annotated[VectorStoreService, Depends(get_vector_store_service)],
 ) -> SeedResponse:
     logger.info(f"Seeding topic: {request.topic}")
 
-    embedding_service = EmbeddingService(voyage_client)
-    vector_store = VectorStoreService(qdrant_client)
-
     try:
         node_id = to_kebab_case(request.topic)
         node = GraphNode(
@@ -100,7 +97,7 @@ async def seed_topic(
             reason="User-provided seed topic",
         )
 
-        node_embedding = await embedding_service.embed_query(request.topic)
+        node_embedding = (await embedding_service.embed([request.topic]))[0]
         await vector_store.store_concept(
             label=request.topic,
             embedding=node_embedding,
@@ -120,20 +117,10 @@ async def seed_topic(
         raise HTTPException(status_code=503, detail=e.message)
 
 
-def cosine_similarity(vec1: list[float], vec2: list[float]) -> float:
-    """Calculate cosine similarity between two vectors."""
-    dot_product = sum(a * b for a, b in zip(vec1, vec2))
-    magnitude1 = sum(a * a for a in vec1) ** 0.5
-    magnitude2 = sum(b * b for b in vec2) ** 0.5
-    if magnitude1 == 0 or magnitude2 == 0:
-        return 0.0
-    return dot_product / (magnitude1 * magnitude2)
-
-
 @router.post("/check-similarity", response_model=SimilarityResponse)
 async def check_similarity(
     request: SimilarityRequest,
-    voyage_client: Annotated[voyageai.Client, Depends(get_voyage_client)],
+    embedding_service: Annotated[EmbeddingService, Depends(get_embedding_service)],
 ) -> SimilarityResponse:
     """
     Check if a topic is semantically related to existing graph context.
@@ -141,24 +128,20 @@ async def check_similarity(
     """
     logger.info(f"Checking similarity for topic: {request.topic}")
 
-    embedding_service = EmbeddingService(voyage_client)
-
     try:
-        # Embed the new topic
-        topic_embedding = await embedding_service.embed_query(request.topic)
-
-        # Embed all context items
-        context_embeddings = await embedding_service.embed(request.context)
+        # Embed the topic and all context items in a single request. Both sides are
+        # short concept labels, so they share the symmetric document embedding.
+        embeddings = await embedding_service.embed([request.topic, *request.context])
 
-        # Calculate similarity with each context item
-        similarities = []
-        for i, ctx_embedding in enumerate(context_embeddings):
-            score = cosine_similarity(topic_embedding, ctx_embedding)
-            similarities.append((request.context[i], score))
+        # Normalize once so cosine similarity reduces to a single matrix-vector product
+        embeddings = l2_normalize(embeddings)
+        topic_vector, context_matrix = embeddings[0], embeddings[1:]
+        scores = context_matrix @ topic_vector
 
         # Find the highest similarity
-        similarities.sort(key=lambda x: x[1], reverse=True)
-        closest_match, highest_score = similarities[0] if similarities else (None, 0.0)
+        best = int(np.argmax(scores))
+        closest_match = request.context[best]
+        highest_score = float(np.clip(scores[best], 0.0, 1.0))
 
         # Determine if related based on threshold
         is_related = highest_score >= request.threshold
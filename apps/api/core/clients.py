@@ -1,19 +1,25 @@
 import logging
 from functools import lru_cache
 
-import voyageai
 from langchain_cerebras import ChatCerebras
 from qdrant_client import AsyncQdrantClient
 
 from core.config import settings
+from core.voyage import VoyageClient
+from services.embedding import EmbeddingService
+from services.inference import InferenceService
+from services.vector_store import VectorStoreService
 
 logger = logging.getLogger(__name__)
 
 
 @lru_cache()
-def get_voyage_client() -> voyageai.Client:
+def get_voyage_client() -> VoyageClient:
     logger.info("Initializing Voyage AI client")
-    return voyageai.Client(api_key=settings.voyage_api_key)
+    return VoyageClient(
+        api_key=settings.voyage_api_key,
+        timeout=settings.api_timeout,
+    )
 
 
 @lru_cache()
@@ -22,6 +28,8 @@ def get_qdrant_client() -> AsyncQdrantClient:
     return AsyncQdrantClient(
         url=settings.qdrant_url,
         api_key=settings.qdrant_api_key,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+        grpc_port=settings.qdrant_grpc_port,
         timeout=settings.api_timeout,
     )
 
@@ -33,3 +41,18 @@ def get_cerebras_llm() -> ChatCerebras:
         model=settings.llm_model,
         api_key=settings.cerebras_api_key,
     )
+
+
+@lru_cache()
+def get_embedding_service() -> EmbeddingService:
+    return EmbeddingService(get_voyage_client())
+
+
+@lru_cache()
+def get_vector_store_service() -> VectorStoreService:
+    return VectorStoreService(get_qdrant_client())
+
+
+@lru_cache()
+def get_inference_service() -> InferenceService:
+    return InferenceService(get_cerebras_llm())
@@ -20,6 +20,10 @@ class Settings(BaseSettings):
     qdrant_url: str = Field(..., min_length=1)
     qdrant_api_key: str = Field(..., min_length=1)
 
+    # Qdrant transport
+    qdrant_prefer_grpc: bool = False
+    qdrant_grpc_port: int = 6334
+
     # CORS
     cors_origins: list[str] = ["http://localhost:3000", "http://127.0.0.1:3000"]
 
@@ -44,11 +48,16 @@ def get_settings() -> Settings:
     return Settings()
 
 
+_settings_instance: Settings | None = None
+
+
 def _lazy_settings() -> Settings:
     """Lazy settings loader - only loads when accessed."""
-    global _settings_instance
-    if "_settings_instance" not in globals():
+    global _settings_instance, settings
+    if _settings_instance is None:
         _settings_instance = get_settings()
+        # Modules importing `settings` from here on get the real object, not the proxy
+        settings = _settings_instance
     return _settings_instance
 
 
@@ -56,7 +65,10 @@ class _SettingsProxy:
     """Proxy that delays settings loading until first access."""
 
     def __getattr__(self, name: str):
-        return getattr(_lazy_settings(), name)
+        value = getattr(_lazy_settings(), name)
+        # Settings don't change after loading, so later lookups can be plain attribute hits
+        object.__setattr__(self, name, value)
+        return value
 
 
 settings = _SettingsProxy()  # type: ignore
@@ -0,0 +1,5 @@
+_KEBAB_CASE_TABLE = str.maketrans({" ": "-", "_": "-"})
+
+
+def to_kebab_case(text: str) -> str:
+    return text.lower().translate(_KEBAB_CASE_TABLE)
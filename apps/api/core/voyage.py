@@ -0,0 +1,34 @@
+import httpx
+
+VOYAGE_API_URL = "https://api.voyageai.com/v1"
+
+
+class VoyageClient:
+    """Async Voyage AI embeddings client over a pooled HTTP/2 connection."""
+
+    def __init__(self, api_key: str, timeout: float):
+        self._http = httpx.AsyncClient(
+            base_url=VOYAGE_API_URL,
+            headers={"Authorization": f"Bearer {api_key}"},
+            http2=True,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+            timeout=timeout,
+        )
+
+    async def embed(self, texts: list[str], model: str, input_type: str) -> list[list[float]]:
+        response = await self._http.post(
+            "/embeddings",
+            json={"input": texts, "model": model, "input_type": input_type},
+        )
+        if response.is_error:
+            # Keep Voyage's error body; it explains why the request was rejected (e.g. 400, 429)
+            raise httpx.HTTPStatusError(
+                f"Voyage API returned {response.status_code}: {response.text}",
+                request=response.request,
+                response=response,
+            )
+        data = sorted(response.json()["data"], key=lambda item: item["index"])
+        return [item["embedding"] for item in data]
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
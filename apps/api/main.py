@@ -1,15 +1,15 @@
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from api.v1.graph import router as graph_router
-from core.clients import get_qdrant_client, get_voyage_client
+from core.clients import get_embedding_service, get_vector_store_service, get_voyage_client
 from core.config import configure_logging, settings
 from models.schemas import HealthResponse
-from services.embedding import EmbeddingService
-from services.vector_store import VectorStoreService
 
 logger = logging.getLogger(__name__)
 
@@ -20,8 +20,7 @@ async def lifespan(app: FastAPI):
     logger.info("Starting Gnosis API")
 
     try:
-        qdrant_client = get_qdrant_client()
-        vector_store = VectorStoreService(qdrant_client)
+        vector_store = get_vector_store_service()
         await vector_store.ensure_collection()
         logger.info("Vector store collection initialized")
     except Exception as e:
@@ -31,6 +30,11 @@ async def lifespan(app: FastAPI):
     yield
 
     logger.info("Shutting down Gnosis API")
+    if get_voyage_client.cache_info().currsize:
+        await get_voyage_client().aclose()
+        # Drop the closed client (and the service holding it) so a later lifespan builds fresh ones
+        get_embedding_service.cache_clear()
+        get_voyage_client.cache_clear()
 
 
 app = FastAPI(
@@ -38,6 +42,7 @@ app = FastAPI(
     description="Real-time semantic mind-mapping engine",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 if settings.environment == "development":
@@ -58,24 +63,24 @@ app.add_middleware(
 app.include_router(graph_router, prefix="/api/v1")
 
 
-@app.get("/health", response_model=HealthResponse)
-async def health_check() -> HealthResponse:
-    services = {}
-
+async def _probe_voyage() -> bool:
     try:
-        voyage_client = get_voyage_client()
-        embedding_service = EmbeddingService(voyage_client)
-        await embedding_service.embed_query("health check")
-        services["voyage"] = True
+        return await get_embedding_service().health_check()
     except Exception:
-        services["voyage"] = False
+        return False
+
 
+async def _probe_qdrant() -> bool:
     try:
-        qdrant_client = get_qdrant_client()
-        vector_store = VectorStoreService(qdrant_client)
-        services["qdrant"] = await vector_store.health_check()
+        return await get_vector_store_service().health_check()
     except Exception:
-        services["qdrant"] = False
+        return False
+
+
+@app.get("/health", response_model=HealthResponse)
+async def health_check() -> HealthResponse:
+    voyage_ok, qdrant_ok = await asyncio.gather(_probe_voyage(), _probe_qdrant())
+    services = {"voyage": voyage_ok, "qdrant": qdrant_ok}
 
     all_healthy = all(services.values())
 
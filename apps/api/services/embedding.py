@@ -1,29 +1,80 @@
 import asyncio
 import logging
+from collections import OrderedDict
+from typing import Literal
 
-import voyageai
+import numpy as np
 
 from core.config import settings
 from core.exceptions import EmbeddingServiceError
+from core.voyage import VoyageClient
 
 logger = logging.getLogger(__name__)
 
+EMBEDDING_CACHE_SIZE = 10_000
+VOYAGE_MAX_CONCURRENCY = 16
+
+CacheKey = tuple[str, str, str]
+
+
+class EmbeddingCache:
+    """In-process LRU of embeddings keyed on (model, input_type, text)."""
+
+    def __init__(self, maxsize: int = EMBEDDING_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[CacheKey, np.ndarray] = OrderedDict()
+
+    def get(self, key: CacheKey) -> np.ndarray | None:
+        embedding = self._entries.get(key)
+        if embedding is not None:
+            self._entries.move_to_end(key)
+        return embedding
+
+    def put(self, key: CacheKey, embedding: np.ndarray) -> None:
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+_embedding_cache = EmbeddingCache()
+_voyage_semaphore = asyncio.Semaphore(VOYAGE_MAX_CONCURRENCY)
+
+
+def l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    """Scale vectors to unit length along the last axis."""
+    return vectors / np.linalg.norm(vectors, axis=-1, keepdims=True).clip(min=1e-12)
+
 
 class EmbeddingService:
-    def __init__(self, client: voyageai.Client):
+    def __init__(self, client: VoyageClient):
         self.client = client
         self.model = settings.embedding_model
+        self.cache = _embedding_cache
+
+    async def embed(
+        self,
+        texts: list[str],
+        input_type: Literal["document", "query"] = "document",
+    ) -> np.ndarray:
+        """Embed texts as a (len(texts), dimension) float32 matrix."""
+        if not texts:
+            return np.empty((0, settings.embedding_dimension), dtype=np.float32)
+
+        keys = [(self.model, input_type, text) for text in texts]
+        embeddings = [self.cache.get(key) for key in keys]
+        missing = list(dict.fromkeys(key for key, embedding in zip(keys, embeddings) if embedding is None))
+        if not missing:
+            return np.stack(embeddings)
 
-    async def embed(self, texts: list[str]) -> list[list[float]]:
         try:
-            logger.debug(f"Embedding {len(texts)} texts with model {self.model}")
-            result = await asyncio.to_thread(
-                self.client.embed,
-                texts,
-                model=self.model,
-                input_type="document",
-            )
-            return result.embeddings
+            logger.debug(f"Embedding {len(missing)} of {len(texts)} texts with model {self.model}")
+            async with _voyage_semaphore:
+                fetched_embeddings = await self.client.embed(
+                    [text for _, _, text in missing],
+                    model=self.model,
+                    input_type=input_type,
+                )
         except Exception as e:
             logger.error(f"Embedding failed: {e}")
             raise EmbeddingServiceError(
@@ -31,19 +82,28 @@ class EmbeddingService:
                 error_code="EMBEDDING_FAILED",
             ) from e
 
-    async def embed_query(self, text: str) -> list[float]:
+        fetched = {}
+        for key, row in zip(missing, np.asarray(fetched_embeddings, dtype=np.float32)):
+            # Copy each row so an entry doesn't keep the whole batch buffer alive, and freeze it
+            # because cached rows are shared between requests
+            embedding = row.copy()
+            embedding.flags.writeable = False
+            fetched[key] = embedding
+            self.cache.put(key, embedding)
+        return np.stack(
+            [embedding if embedding is not None else fetched[key] for key, embedding in zip(keys, embeddings)]
+        )
+
+    async def embed_query(self, text: str) -> np.ndarray:
+        logger.debug(f"Embedding query: {text[:50]}...")
+        embeddings = await self.embed([text], input_type="query")
+        return embeddings[0]
+
+    async def health_check(self) -> bool:
+        # Bypass the cache so the probe always reaches Voyage
         try:
-            logger.debug(f"Embedding query: {text[:50]}...")
-            result = await asyncio.to_thread(
-                self.client.embed,
-                [text],
-                model=self.model,
-                input_type="query",
-            )
-            return result.embeddings[0]
-        except Exception as e:
-            logger.error(f"Query embedding failed: {e}")
-            raise EmbeddingServiceError(
-                message=f"Failed to generate query embedding: {e}",
-                error_code="EMBEDDING_FAILED",
-            ) from e
+            async with _voyage_semaphore:
+                await self.client.embed(["health check"], model=self.model, input_type="query")
+            return True
+        except Exception:
+            return False
@@ -4,37 +4,12 @@ from langchain_cerebras import ChatCerebras
 from pydantic import BaseModel
 
 from core.exceptions import InferenceError
+from core.text import to_kebab_case
 from models.schemas import GraphEdge, GraphNode
 
 logger = logging.getLogger(__name__)
 
-
-class ExpansionOutput(BaseModel):
-    nodes: list[GraphNode]
-    edges: list[GraphEdge]
-    reasoning: str
-
-
-class InferenceService:
-    def __init__(self, llm: ChatCerebras):
-        self.llm = llm.with_structured_output(ExpansionOutput)
-
-    async def expand_topic(
-        self,
-        topic: str,
-        context: list[str],
-        similar_concepts: list[dict],
-        num_expansions: int = 5,
-        source_node_id: str | None = None,
-    ) -> ExpansionOutput:
-        try:
-            similar_str = ", ".join(c["label"] for c in similar_concepts[:5]) if similar_concepts else "none yet"
-            context_str = ", ".join(context) if context else "none"
-
-            # Use provided source_node_id or derive from topic
-            edge_source_id = source_node_id if source_node_id else topic.lower().replace(" ", "-").replace("_", "-")
-
-            prompt = f"""You are a knowledge graph expansion assistant. Given a topic, generate related concepts that would form an interesting semantic mind map.
+EXPANSION_PROMPT = """You are a knowledge graph expansion assistant. Given a topic, generate related concepts that would form an interesting semantic mind map.
 
 Topic to expand: {topic}
 Current context/path: {context_str}
@@ -61,6 +36,42 @@ IMPORTANT: All edges must have source="{edge_source_id}". Do not use any other s
 
 Also provide overall reasoning explaining your expansion choices."""
 
+
+class ExpansionOutput(BaseModel):
+    nodes: list[GraphNode]
+    edges: list[GraphEdge]
+    reasoning: str
+
+
+class InferenceService:
+    def __init__(self, llm: ChatCerebras):
+        self.llm = llm.with_structured_output(ExpansionOutput)
+
+    async def expand_topic(
+        self,
+        topic: str,
+        context: list[str],
+        similar_concepts: list[str],
+        num_expansions: int = 5,
+        source_node_id: str | None = None,
+    ) -> ExpansionOutput:
+        try:
+            similar_str = ", ".join(similar_concepts[:5]) if similar_concepts else "none yet"
+            context_str = ", ".join(context) if context else "none"
+
+            # Use provided source_node_id or derive from topic
+            edge_source_id = source_node_id if source_node_id else to_kebab_case(topic)
+
+            prompt = EXPANSION_PROMPT.format_map(
+                {
+                    "topic": topic,
+                    "context_str": context_str,
+                    "similar_str": similar_str,
+                    "num_expansions": num_expansions,
+                    "edge_source_id": edge_source_id,
+                }
+            )
+
             logger.debug(f"Expanding topic: {topic} with {num_expansions} expansions, source_node_id: {edge_source_id}")
             result = await self.llm.ainvoke(prompt)
 
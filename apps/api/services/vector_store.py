@@ -1,15 +1,21 @@
+import asyncio
 import logging
 import uuid
 
+import numpy as np
 from qdrant_client import AsyncQdrantClient
 from qdrant_client.models import Distance, PointStruct, VectorParams
 
 from core.config import settings
 from core.exceptions import VectorStoreError
+from services.embedding import l2_normalize
 
 logger = logging.getLogger(__name__)
 
 COLLECTION_NAME = "gnosis_concepts"
+QDRANT_MAX_CONCURRENCY = 32
+
+_qdrant_semaphore = asyncio.Semaphore(QDRANT_MAX_CONCURRENCY)
 
 
 class VectorStoreService:
@@ -28,7 +34,7 @@ class VectorStoreService:
                     collection_name=self.collection_name,
                     vectors_config=VectorParams(
                         size=settings.embedding_dimension,
-                        distance=Distance.COSINE,
+                        distance=Distance.DOT,
                     ),
                 )
         except Exception as e:
@@ -38,22 +44,20 @@ class VectorStoreService:
                 error_code="VECTOR_STORE_INIT_FAILED",
             ) from e
 
-    async def search_similar(
+    async def search_similar_labels(
         self,
-        embedding: list[float],
+        embedding: np.ndarray,
         limit: int = 10,
-    ) -> list[dict]:
+    ) -> list[str]:
         try:
             logger.debug(f"Searching for {limit} similar concepts")
-            results = await self.client.query_points(
-                collection_name=self.collection_name,
-                query=embedding,
-                limit=limit,
-            )
-            return [
-                {"id": str(point.id), "label": point.payload.get("label", ""), "score": point.score}
-                for point in results.points
-            ]
+            async with _qdrant_semaphore:
+                results = await self.client.query_points(
+                    collection_name=self.collection_name,
+                    query=l2_normalize(embedding).tolist(),
+                    limit=limit,
+                )
+            return [point.payload.get("label", "") for point in results.points]
         except Exception as e:
             logger.error(f"Vector search failed: {e}")
             raise VectorStoreError(
@@ -64,27 +68,38 @@ class VectorStoreService:
     async def store_concept(
         self,
         label: str,
-        embedding: list[float],
+        embedding: np.ndarray,
         metadata: dict | None = None,
     ) -> str:
+        point_ids = await self.store_concepts([(label, embedding, metadata)])
+        return point_ids[0]
+
+    async def store_concepts(
+        self,
+        items: list[tuple[str, np.ndarray, dict | None]],
+    ) -> list[str]:
+        if not items:
+            return []
+
         try:
-            point_id = str(uuid.uuid4())
-            payload = {"label": label, **(metadata or {})}
+            points = [
+                PointStruct(
+                    id=str(uuid.uuid4()),
+                    vector=l2_normalize(embedding).tolist(),
+                    payload={"label": label, **(metadata or {})},
+                )
+                for label, embedding, metadata in items
+            ]
 
-            logger.debug(f"Storing concept: {label}")
-            await self.client.upsert(
-                collection_name=self.collection_name,
-                points=[
-                    PointStruct(
-                        id=point_id,
-                        vector=embedding,
-                        payload=payload,
-                    )
-                ],
-            )
-            return point_id
+            logger.debug(f"Storing {len(points)} concepts")
+            async with _qdrant_semaphore:
+                await self.client.upsert(
+                    collection_name=self.collection_name,
+                    points=points,
+                )
+            return [point.id for point in points]
         except Exception as e:
-            logger.error(f"Failed to store concept: {e}")
+            logger.error(f"Failed to store concepts: {e}")
             raise VectorStoreError(
                 message=f"Failed to store concept: {e}",
                 error_code="VECTOR_STORE_FAILED",